@@ -3,29 +3,37 @@
 #SET YOUR WHATCMS API KEY HERE
 cmsapikey=
 
+#Shared curl options for every API request
+curlopts=(--silent --compressed --retry 2 --retry-delay 10 --connect-timeout 5 --max-time 60 --retry-max-time 60)
+
+#Cached API answers live next to the script
+readonly cachedir="$(dirname "$0")/.whatcms_cache"
+
 #Banner function
 banner()
 {
-	echo ""
-	echo "-------------------------------------------------------------"	
-	echo ""
-	echo ""
-	echo -e "\e[1;36m██╗    ██╗██╗  ██╗ █████╗ ████████╗ ██████╗███╗   ███╗███████╗"
-	echo -e "██║    ██║██║  ██║██╔══██╗╚══██╔══╝██╔════╝████╗ ████║██╔════╝"
-	echo -e "██║ █╗ ██║███████║███████║   ██║   ██║     ██╔████╔██║███████╗"
-	echo -e "██║███╗██║██╔══██║██╔══██║   ██║   ██║     ██║╚██╔╝██║╚════██║"
-	echo -e "╚███╔███╔╝██║  ██║██║  ██║   ██║   ╚██████╗██║ ╚═╝ ██║███████║"
-	echo -e " ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝    ╚═════╝╚═╝     ╚═╝╚══════╝\e[0m"
-    echo ""
-    echo ""                                                          
-	echo -e "   CMS Detection and Exploit Kit based on \e[1mWhatCMS.org\e[0m API"
-	echo ""
-	echo -e "\e[1m  --------------------\e[0m"
-	echo -e "\e[1m |\e[0m \e[1;36mCMS database: 331\e[0m  \e[1m|\e[0m"
-	echo -e "\e[1m |\e[0m \e[1;36mTools database: 44\e[0m \e[1m|\e[0m"
-	echo -e "\e[1m  --------------------\e[0m"
-	echo -e "                                           \e[2;3;36mdeveloped by HATI\e[0m"
-	echo "-------------------------------------------------------------"
+	#One printf call writes the whole banner
+	printf '%b\n' \
+		"" \
+		"-------------------------------------------------------------" \
+		"" \
+		"" \
+		"\e[1;36m██╗    ██╗██╗  ██╗ █████╗ ████████╗ ██████╗███╗   ███╗███████╗" \
+		"██║    ██║██║  ██║██╔══██╗╚══██╔══╝██╔════╝████╗ ████║██╔════╝" \
+		"██║ █╗ ██║███████║███████║   ██║   ██║     ██╔████╔██║███████╗" \
+		"██║███╗██║██╔══██║██╔══██║   ██║   ██║     ██║╚██╔╝██║╚════██║" \
+		"╚███╔███╔╝██║  ██║██║  ██║   ██║   ╚██████╗██║ ╚═╝ ██║███████║" \
+		" ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝    ╚═════╝╚═╝     ╚═╝╚══════╝\e[0m" \
+		"" \
+		"" \
+		"   CMS Detection and Exploit Kit based on \e[1mWhatCMS.org\e[0m API" \
+		"" \
+		"\e[1m  --------------------\e[0m" \
+		"\e[1m |\e[0m \e[1;36mCMS database: 331\e[0m  \e[1m|\e[0m" \
+		"\e[1m |\e[0m \e[1;36mTools database: 44\e[0m \e[1m|\e[0m" \
+		"\e[1m  --------------------\e[0m" \
+		"                                           \e[2;3;36mdeveloped by HATI\e[0m" \
+		"-------------------------------------------------------------"
 }
 
 #APIKEYcheck
@@ -47,8 +55,6 @@ trashdel()
 	rm tmpver
 	echo " " > tmptools2
 	rm tmptools2
-	echo " " > tmpgit
-	rm tmpgit
 	echo " " > tmptools
 	rm tmptools
 	echo " " > tmp
@@ -70,42 +76,66 @@ domaincheck()
 	fi
 }
 
+#Fetch function
+fetch()
+{
+	curl "${curlopts[@]}" "$@"
+}
+
 #WhatCMS function
 whatcms()
 {
-    curl -s "https://whatcms.org/APIEndpoint?key=$cmsapikey&url="$1 > tmp
-    api=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^msg/ {print $2}' | sed 's/\(^"\|"$\)//g' | grep -c Invalid)
-    if [[ $api == 1 ]];then
+    #Reuse a cached answer younger than 6 hours
+    cachefile="$cachedir/${1//\//_}"
+    if [[ -n $(find "$cachefile" -mmin -360 2>/dev/null) ]];then
+    	cp "$cachefile" tmp
+    	fromcache=1
+    	cachenote=" \e[2m(cached)\e[0m"
+    else
+    	fromcache=0
+    	cachenote=""
+    	fetch -G "https://whatcms.org/APIEndpoint" --data-urlencode "key=$cmsapikey" --data-urlencode "url=$1" > tmp
+    fi
+    #Parse msg, name and version in a single pass
+    IFS=$'\x1d' read -r msg cms version < <(sed -e 's/[{}]/''/g' tmp | awk -v RS=',"' -F: '
+    	function val(f) { sub(/\n.*/, "", f); gsub(/^"|"$/, "", f); return f }
+    	/^msg/ {m=val($2)} /^name/ {n=val($2)} /^version/ {v=val($2)}
+    	END {print m "\035" n "\035" v}')
+    if [[ $msg == *Invalid* ]];then
     	echo -e " \e[38;5;196;1m[#] Invalid API key.\e[0m"
     	echo -e " \e[1m[-] Set your WhatCMS API Key on the source code.\e[0m"
     	echo ""
     	exit 0
     else
-    	cms=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^name/ {print $2}' | sed 's/\(^"\|"$\)//g')
-    	version=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^version/ {print $2}' | sed 's/\(^"\|"$\)//g')
-    	echo ""
-    	echo -e " \e[1m[URL]: \e[1;36m$1\e[0m"
-    	echo ""
-    	echo -e " \e[1m[CMS]: \e[1;92m$cms\e[0m"
-    	echo ""
-    	echo -e " \e[1m[VERSION]: \e[1;92m$version\e[0m"
+    	if [[ $fromcache == 0 ]] && [[ -n $cms ]] && [[ $cms != "null" ]];then
+    		#The script directory may not be writable, caching is best effort
+    		mkdir -p "$cachedir" 2>/dev/null && cp tmp "$cachefile.$$" 2>/dev/null && mv -f "$cachefile.$$" "$cachefile" 2>/dev/null
+    	fi
+    	printf '%b\n' \
+    		"" \
+    		" \e[1m[URL]: \e[1;36m$1\e[0m$cachenote" \
+    		"" \
+    		" \e[1m[CMS]: \e[1;92m$cms\e[0m" \
+    		"" \
+    		" \e[1m[VERSION]: \e[1;92m$version\e[0m"
     fi
 }
 
 #WhoHOST function
 whohost()
 {
-	curl -s "https://www.who-hosts-this.com/APIEndpoint?key=$cmsapikey&url="$1 > tmp
+	fetch -G "https://www.who-hosts-this.com/APIEndpoint" --data-urlencode "key=$cmsapikey" --data-urlencode "url=$1" > tmp
 	api=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^msg/ {print $2}' | sed 's/\(^"\|"$\)//g' | grep -c Invalid)
   	isp=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^isp_name/ {print $2}' | sed 's/\(^"\|"$\)//g' | sort | uniq | tr '\n' ' ')
 	ip=$(grep -o '[0-9]\{1,3\}\.[0-9]\{1,3\}\.[0-9]\{1,3\}\.[0-9]\{1,3\}' tmp | sort | uniq | tr '\n' ' ')
 	type=$(cat tmp | sed -e 's/[{}]/''/g' | awk -v RS=',"' -F: '/^type/ {print $2}' | sed 's/\(^"\|"$\)//g' | sort | uniq | tr '\n' ' ')
-	echo ""
-	echo -e " \e[1m[ISP]: \e[1;36m$isp\e[0m"
-	echo ""
-	echo -e " \e[1m[IP]: \e[1;36m$ip\e[0m"
-	echo ""
-	echo -e " \e[1m[TYPE] \e[1;36m$type\e[0m"
+	printf '%b\n' \
+		"" \
+		" \e[1m[ISP]: \e[1;36m$isp\e[0m" \
+		"" \
+		" \e[1m[IP]: \e[1;36m$ip\e[0m" \
+		"" \
+		" \e[1m[TYPE] \e[1;36m$type\e[0m"
 }
 
 #CMSToolsask function
@@ -113,16 +143,26 @@ cmstoolsask()
 {
 	echo ""
 	echo "-------------------------------------------------------------"
-	echo  -e "DruPal\nJoomla\nSPIP\nWordpress\nDrupal\nXen\nBigTreeCMS\nDrupal\nWeBid\nDiscuz\nvbulletin\nHeroku\nOpenCart\nPHPBB\nBugzilla\nMambo\nWolf\nStartBBS\nMadeSimple\nVeyton\nMagento\nMagento\nshopify\nMagento\nPrestashop\nMoodle\nmyBB\nCentreon\nTYPO3CMS\nBetoffice\nWaiKu\nLokomedia\nOpenCart\nuseBB\nEZPublish\nClaroline\nFly-High\nAllCMS\nxt-commerce\nvanilla\nTypo3\nPlone\nsquarespace\nClipperCMS\nPrestashop\nHavalite\nWebspell\ntumblr\nbbPress\nPhpMyAdmin\nCMSMS\nPivotX\nPhpTax\nCMSimple\nAlchemyCMS\nimacs\nMantis\nCollabtive\nConcrete5\nCoppermine\nCotonti\nCroogo\nCubeCart\nDolibarr\nDotclear\ne107\nEspoCRM\nEtherpad\nFluxBB\nFoswiki\nGallery\nGollum\nHelpDEZk\nHumHub\nImpressCMS\nImpressPages\nJamroom\nKanboard\nKCFinder\nLiteCart\nMagnolia\nMahara\nMantisBT\nMediaWiki\nMicroweber\nMiniBB\nMODXRevolution\nMoinMoin\nNibbleblog\nOpenSourceSocialNetwork\nOpenCart\nosDate\nownCloud\nOxwall\nPBBoard\nphpBB3\nPhpGedView\nPiwigo\nPiwik\nPmWiki\nPostfixAdmin\nRedaxo\nRoundcube\nSaurusCMS\nSerendipity\nShaarli\nSimple Machines Forum\nSpinaCMS\nSquirrelMail\nTestLink\nTikiWiki\nTrac\nWikkaWiki\nZenphoto\nX-Cart\nZikula\nMoodle\nBeehive\nFUDforum\npunBB\nAcmImBoard\nBurning\nCommunity\nfusionBB\ndeluxeBB\nJFORUM\nJive\nJibit\nNear\nOVBB\nTikiWiki\nSPIP\nConcrete5" > cmstmp
-	verify=$(grep -c -i "$cms" cmstmp)
-	if [[ $cms == "null" ]];then
+	#An empty name means no usable API answer, keep it apart from null
+	if [[ -z $cms ]];then
+		echo ""
+		echo -e " \e[38;5;196;1m[#] CMS lookup failed.\e[0m"
+		echo -e " \e[1m[-] No answer from the WhatCMS API, try again later.\e[0m"
+		echo ""
+		echo "-------------------------------------------------------------"
+		echo ""
+		exit 0
+	elif [[ $cms == "null" ]];then
 		echo ""
 		echo -e " \e[38;5;196;1m[#] CMS not detected.\e[0m"
 		echo ""
 		echo "-------------------------------------------------------------"
 		echo ""
 		exit 0
-	elif [[ $verify == 0 ]];then
+	fi
+	echo  -e "DruPal\nJoomla\nSPIP\nWordpress\nDrupal\nXen\nBigTreeCMS\nDrupal\nWeBid\nDiscuz\nvbulletin\nHeroku\nOpenCart\nPHPBB\nBugzilla\nMambo\nWolf\nStartBBS\nMadeSimple\nVeyton\nMagento\nMagento\nshopify\nMagento\nPrestashop\nMoodle\nmyBB\nCentreon\nTYPO3CMS\nBetoffice\nWaiKu\nLokomedia\nOpenCart\nuseBB\nEZPublish\nClaroline\nFly-High\nAllCMS\nxt-commerce\nvanilla\nTypo3\nPlone\nsquarespace\nClipperCMS\nPrestashop\nHavalite\nWebspell\ntumblr\nbbPress\nPhpMyAdmin\nCMSMS\nPivotX\nPhpTax\nCMSimple\nAlchemyCMS\nimacs\nMantis\nCollabtive\nConcrete5\nCoppermine\nCotonti\nCroogo\nCubeCart\nDolibarr\nDotclear\ne107\nEspoCRM\nEtherpad\nFluxBB\nFoswiki\nGallery\nGollum\nHelpDEZk\nHumHub\nImpressCMS\nImpressPages\nJamroom\nKanboard\nKCFinder\nLiteCart\nMagnolia\nMahara\nMantisBT\nMediaWiki\nMicroweber\nMiniBB\nMODXRevolution\nMoinMoin\nNibbleblog\nOpenSourceSocialNetwork\nOpenCart\nosDate\nownCloud\nOxwall\nPBBoard\nphpBB3\nPhpGedView\nPiwigo\nPiwik\nPmWiki\nPostfixAdmin\nRedaxo\nRoundcube\nSaurusCMS\nSerendipity\nShaarli\nSimple Machines Forum\nSpinaCMS\nSquirrelMail\nTestLink\nTikiWiki\nTrac\nWikkaWiki\nZenphoto\nX-Cart\nZikula\nMoodle\nBeehive\nFUDforum\npunBB\nAcmImBoard\nBurning\nCommunity\nfusionBB\ndeluxeBB\nJFORUM\nJive\nJibit\nNear\nOVBB\nTikiWiki\nSPIP\nConcrete5" > cmstmp
+	verify=$(grep -c -i "$cms" cmstmp)
+	if [[ $verify == 0 ]];then
 		echo ""   
         echo -e " \e[38;5;196;1m[#] The CMS is not on the tool database.\e[0m"
         echo ""
@@ -162,51 +202,6 @@ cmstoolscheck()
 #CMSTools
 cmstools()
 {
-	xbf=$(echo $XBruteForcer | cut -d "-" -f 5 | grep -c -i "$cms")
-	CMSs4=$(echo $CMSsc4n | cut -d "-" -f 5 | grep -c -i "$cms")
-	CMSon=$(echo $CoMisSion | cut -d "-" -f 5 | grep -c -i "$cms")
-	droop=$(echo $droopescan | cut -d "-" -f 5 | grep -c -i "$cms")
-	map=$(echo $CMSmap | cut -d "-" -f 5 | grep -c -i "$cms")
-	joom=$(echo $JoomScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	bee=$(echo $beecms | cut -d "-" -f 5 | grep -c -i "$cms")
-	dumb=$(echo $Dumb0 | cut -d "-" -f 5 | grep -c -i "$cms")
-	vbs=$(echo $VBScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	joom2=$(echo $JoomlaScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	c5=$(echo $c5scan | cut -d "-" -f 5 | grep -c -i "$cms")
-	t3=$(echo $T3scan | cut -d "-" -f 5 | grep -c -i "$cms")
-	pup=$(echo $Puppet | cut -d "-" -f 5 | grep -c -i "$cms")
-	mood=$(echo $moodlescan | cut -d "-" -f 5 | grep -c -i "$cms")
-	spip=$(echo $SPIPScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	wphu=$(echo $WPHunter | cut -d "-" -f 5 | grep -c -i "$cms")
-	wpsek=$(echo $WPSeku | cut -d "-" -f 5 | grep -c -i "$cms")
-	acdr=$(echo $acdrupal | cut -d "-" -f 5 | grep -c -i "$cms")
-	plo=$(echo $Plown | cut -d "-" -f 5 | grep -c -i "$cms")
-	pyf=$(echo $pyfiscan | cut -d "-" -f 5 | grep -c -i "$cms")
-	con=$(echo $conscan | cut -d "-" -f 5 | grep -c -i "$cms")
-	cmsss=$(echo $CMSScanner | cut -d "-" -f 5 | grep -c -i "$cms")
-	cmse=$(echo $cmsexplorer | cut -d "-" -f 5 | grep -c -i "$cms")
-	wpsc=$(echo $WPScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	xplsc=$(echo $XPL | cut -d "-" -f 5 | grep -c -i "$cms")
-	jme=$(echo $JoomME | cut -d "-" -f 5 | grep -c -i "$cms")
-	wme=$(echo $WordPressME | cut -d "-" -f 5 | grep -c -i "$cms")
-	cef=$(echo $CMSEF | cut -d "-" -f 5 | grep -c -i "$cms")
-	lcms=$(echo $Lotus | cut -d "-" -f 5 | grep -c -i "$cms")
-	bmcms=$(echo $BadMod | cut -d "-" -f 5 | grep -c -i "$cms")
-	moo=$(echo $MooScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	xa=$(echo $XAttacker | cut -d "-" -f 5 | grep -c -i "$cms")
-	mob=$(echo $M0B | cut -d "-" -f 5 | grep -c -i "$cms")
-	lmfi=$(echo $LetMeFuckIt | cut -d "-" -f 5 | grep -c -i "$cms")
-	mcms=$(echo $magescan | cut -d "-" -f 5 | grep -c -i "$cms")
-	pcms=$(echo $PRESTA | cut -d "-" -f 5 | grep -c -i "$cms")
-	scms=$(echo $sc | cut -d "-" -f 5 | grep -c -i "$cms")
-	ekcms=$(echo $ektrone | cut -d "-" -f 5 | grep -c -i "$cms")
-	lrs=$(echo $LiferayScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	ifl=$(echo $InfoLeak | cut -d "-" -f 5 | grep -c -i "$cms")
-	jlavs=$(echo $joomlavs | cut -d "-" -f 5 | grep -c -i "$cms")
-	was=$(echo $WAScan | cut -d "-" -f 5 | grep -c -i "$cms")
-	rhw=$(echo $RedHawk | cut -d "-" -f 5 | grep -c -i "$cms")
-	hostsbf=$(echo $HostileSBF | cut -d "-" -f 5 | grep -c -i "$cms")
-
 	echo "-------------------------------------------------------------"
 	echo ""
 	echo -e " \e[1m[-] Available tools for \e[1;36m$cms:\e[0m"
@@ -216,178 +211,17 @@ cmstools()
 	echo -e " \e[1m           TOOL        - ID -         UTILITY\e[0m" >> tmptools
 	echo "     --" >> tmptools
 
-	if [[ $xbf == 1 ]];then
-		echo "     "$XBruteForcer | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $CMSs4 == 1 ]]; then
-		echo "     "$CMSsc4n | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $CMSon == 1 ]]; then
-		echo "     "$CoMisSion | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $droop == 1 ]]; then
-		echo "     "$droopescan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $map == 1 ]]; then
-		echo "     "$CMSmap | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $joom == 1 ]]; then
-		echo "     "$JoomScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $bee == 1 ]]; then
-		echo "     "$beecms | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $dumb == 1 ]]; then
-		echo "     "$Dumb0 | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $vbs == 1 ]]; then
-		echo "     "$VBScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $joom2 == 1 ]]; then
-		echo "     "$JoomlaScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $c5 == 1 ]]; then
-		echo "     "$c5scan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $t3 == 1 ]]; then
-		echo "     "$T3scan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $pup == 1 ]]; then
-		echo "     "$Puppet | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $mood == 1 ]]; then
-		echo "     "$moodlescan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $spip == 1 ]]; then
-		echo "     "$SPIPScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $wphu == 1 ]]; then
-		echo "     "$WPHunter | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $wpsek == 1 ]]; then
-		echo "     "$WPSeku | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $acdr == 1 ]]; then
-		echo "     "$acdrupal | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $plo == 1 ]]; then
-		echo "     "$Plown | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $pyf == 1 ]]; then
-		echo "     "$pyfiscan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $con == 1 ]]; then
-		echo "     "$conscan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $cmsss == 1 ]]; then
-		echo "     "$CMSScanner | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $cmse == 1 ]]; then
-		echo "     "$cmsexplorer | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $wpsc == 1 ]]; then
-		echo "     "$WPScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $xplsc == 1 ]]; then
-		echo "     "$XPL | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $jme == 1 ]]; then
-		echo "     "$JoomME | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $wme == 1 ]]; then
-		echo "     "$WordPressME | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $cef == 1 ]]; then
-		echo "     "$CMSEF | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $lcms == 1 ]]; then
-		echo "     "$Lotus | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $bmcms == 1 ]]; then
-		echo "     "$BadMod | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $moo == 1 ]]; then
-		echo "     "$MooScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $mob == 1 ]]; then
-		echo "     "$M0B | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $lmfi == 1 ]]; then
-		echo "     "$LetMeFuckIt | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $mcms == 1 ]]; then
-		echo "     "$magescan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $pcms == 1 ]]; then
-		echo "     "$PRESTA | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $scms == 1 ]]; then
-		echo "     "$sc | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $ekcms == 1 ]]; then
-		echo "     "$ektrone | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $lrs == 1 ]]; then
-		echo "     "$LiferayScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $ifl == 1 ]]; then
-		echo "     "$InfoLeak | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $jlavs == 1 ]]; then
-		echo "     "$joomlavs | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $was == 1 ]]; then
-		echo "     "$WAScan | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $rhw == 1 ]]; then
-		echo "     "$RedHawk | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
-	if [[ $hostsbf == 1 ]]; then
-		echo "     "$HostileSBF | cut -d "-" -f 1,2,3 >> tmptools
-		echo "     --" >> tmptools
-	fi
+	#Match on the CMS list after the last " - ", without a subshell per tool
+	lcms=${cms,,}
+	for tool in "${toolslist[@]}"
+	do
+		supported=${!tool##* - }
+		if [[ ${supported,,} == *"$lcms"* ]];then
+			row=${!tool}
+			echo "     "${row%% -[[:space:]]http*}" " >> tmptools
+			echo "     --" >> tmptools
+		fi
+	done
 	column -t -s "-" tmptools
 	echo ""
 }
@@ -424,13 +258,16 @@ cmstoolsgit()
 			tmpverr=$(cat tmpver)
 			
 				if [[  $tmpverr == "1" ]];then
-					echo ${!line} | cut -d "-" -f 4 > tmpgit
-					github=$(cat tmpgit)
-					echo ""
-					git clone $github /root/cmstools/$line
-					echo ""
-					echo -e " \e[1;36m[+] Tool cloned in\e[0m \e[1;96m/root/cmstools/$line.\e[0m"
-					echo ""
+					[[ ${!line} =~ (https?://[^[:space:]]+) ]] && github=${BASH_REMATCH[1]}
+					#Clone in background, the repos are independent
+					#No credential prompts, they would compete for the same terminal
+					{
+						GIT_TERMINAL_PROMPT=0 git clone -q --depth 1 $github /root/cmstools/$line && \
+						printf '%b\n' \
+							"" \
+							" \e[1;36m[+] Tool cloned in\e[0m \e[1;96m/root/cmstools/$line.\e[0m" \
+							""
+					} &
 					(( con2 += 1 ))
 					(( con += 1 ))
 				else
@@ -440,6 +277,8 @@ cmstoolsgit()
 			done		
 			
 	done < tmptools2
+	echo ""
+	wait
 }
 
 #Help function
@@ -514,6 +353,9 @@ WAScan=' WAScan - 42 - Analyze Tool - https://github.com/m4ll0k/WAScan - Drupal,
 RedHawk=' RedHawk - 43 - Analyze Tool - https://github.com/Tuhinshubhra/RED_HAWK - Wordpress, Drupal, Joomla, Magento'
 HostileSBF=' HostileSBF - 44 - Analyze Tool - https://github.com/nahamsec/HostileSubBruteforcer - AWS, Github, Heroku, shopify, tumblr, squarespace'
 
+#Tools table, in ID order
+toolslist=(XBruteForcer CMSsc4n CoMisSion droopescan CMSmap JoomScan beecms Dumb0 VBScan JoomlaScan c5scan T3scan Puppet moodlescan SPIPScan WPHunter WPSeku acdrupal Plown pyfiscan conscan CMSScanner cmsexplorer WPScan XPL JoomME WordPressME CMSEF Lotus BadMod MooScan XAttacker M0B LetMeFuckIt magescan PRESTA sc ektrone LiferayScan InfoLeak joomlavs WAScan RedHawk HostileSBF)
+
 #-------------------------------------------------------------------------------------------------------------------------------
 banner
 apikeycheck
@@ -527,7 +369,10 @@ else
 	if [[ $verify != "0" ]];then
 		whatcms $1
 		if [[ $2 == "-wh" ]];then
-			sleep 9
+			#Wait out the API rate limit, unless whatcms was answered from cache
+			if [[ $fromcache == 0 ]];then
+				sleep 9
+			fi
 			whohost $1
 		fi
 		cmstoolsask